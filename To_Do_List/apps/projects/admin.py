@@ -8,5 +8,5 @@ class ProjectAdmin(admin.ModelAdmin):
     list_display = ["name", "owner", "created_at", "updated_at"]
     list_filter = ["created_at", "updated_at"]
     search_fields = ["name", "description", "owner__email"]
-    readonly_fields = ["id", "created_at", "updated_at"]
+    readonly_fields = ["id", "public_id", "created_at", "updated_at"]
     raw_id_fields = ["owner"]
@@ -0,0 +1,98 @@
+"""Caching helpers for rendered project fragments."""
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.middleware.csrf import get_token
+from django.utils.http import quote_etag
+
+from apps.tasks.models import Task
+
+from .models import Project
+
+PROJECTS_ALL_CACHE_TIMEOUT = 300  # 5 minutes
+PROJECT_DETAIL_CACHE_TIMEOUT = 300  # 5 minutes
+
+
+async def projects_version(user) -> str:
+    """
+    Return a token that changes whenever the user's projects or tasks change.
+
+    Combines row counts (deletes) with the latest ``updated_at`` (creates and
+    edits) of both tables, so cached fragments are invalidated implicitly
+    without having to track and delete individual keys.
+
+    Args:
+        user: Owner whose projects and tasks are versioned
+
+    Returns:
+        str: Hex digest identifying the current state of the data
+    """
+    projects = await Project.objects.for_user(user).aaggregate(
+        count=Count("pk"), updated=Max("updated_at")
+    )
+    tasks = await Task.objects.filter(project__owner=user).aaggregate(
+        count=Count("pk"), updated=Max("updated_at")
+    )
+    state = (projects["count"], projects["updated"], tasks["count"], tasks["updated"])
+    return hashlib.md5(repr(state).encode(), usedforsecurity=False).hexdigest()
+
+
+async def projects_all_cache_key(request, user) -> str:
+    """
+    Build the cache key for the rendered ``projects_all.html`` fragment.
+
+    The fragment embeds CSRF tokens, so the key also includes a digest of the
+    CSRF secret; a cached fragment is never served to a session whose secret
+    has been rotated (e.g. after logging in again).
+
+    Args:
+        request: Current request
+        user: Authenticated user, as resolved by ``request.auser()``
+
+    Returns:
+        str: Cache key for the user's projects fragment
+    """
+    get_token(request)  # Ensure the CSRF secret exists and the cookie is sent
+    csrf = hashlib.md5(request.META["CSRF_COOKIE"].encode(), usedforsecurity=False).hexdigest()
+    return f"projects_all:{user.pk}:{csrf}:{await projects_version(user)}"
+
+
+def projects_all_etag(cache_key: str) -> str:
+    """
+    Derive the ETag of the ``projects_all.html`` fragment from its cache key.
+
+    Args:
+        cache_key: Key returned by ``projects_all_cache_key``
+
+    Returns:
+        str: Quoted ETag that changes whenever the cached fragment would
+    """
+    return quote_etag(hashlib.md5(cache_key.encode(), usedforsecurity=False).hexdigest())
+
+
+def project_detail_cache_key(user, project_public_id) -> str:
+    """
+    Build the cache key for a rendered project detail page.
+
+    Like ``projects_version``, the key is derived from the database: the
+    project's ``updated_at`` plus the count and latest ``updated_at`` of its
+    tasks, read in one aggregate query. Every worker process, and writes made
+    outside the views (admin, shell), therefore invalidate it immediately.
+
+    Args:
+        user: Owner of the project
+        project_public_id: Public UUID of the project
+
+    Returns:
+        str: Cache key that changes whenever the project or its tasks change
+    """
+    state = (
+        Project.objects.for_user(user)
+        .filter(public_id=project_public_id)
+        .aggregate(
+            updated=Max("updated_at"), count=Count("tasks"), tasks_updated=Max("tasks__updated_at")
+        )
+    )
+    version = hashlib.md5(repr(tuple(state.values())).encode(), usedforsecurity=False).hexdigest()
+    return f"project_detail:{user.pk}:{project_public_id}:{version}"
@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.tasks.models import Task
+
 
 class OwnedQuerySet(models.QuerySet):
     """QuerySet that filters objects by owner."""
@@ -9,12 +11,58 @@ class OwnedQuerySet(models.QuerySet):
         return self.filter(owner=user)
 
 
-class OwnedManager(models.Manager):
-    """Manager that provides OwnedQuerySet."""
+class ProjectQuerySet(OwnedQuerySet):
+    """
+    Project QuerySet that can attach tasks as read-only rows.
 
-    def get_queryset(self):
-        return OwnedQuerySet(self.model, using=self._db)
+    ``with_task_rows()`` makes evaluation attach each project's tasks to
+    ``project.tasks_list`` as named tuples instead of Task instances, which
+    are far cheaper to build and hold for template-only rendering.
+    """
 
-    def for_user(self, user):
-        """Filter objects to only include those owned by the given user."""
-        return self.get_queryset().for_user(user)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._task_rows = None
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._task_rows = self._task_rows
+        return clone
+
+    def with_task_rows(self, fields, ordering=()):
+        """
+        Attach tasks as named tuples when the queryset is evaluated.
+
+        Args:
+            fields: Task fields to load into each row (e.g. "pk", "title")
+            ordering: Order of the rows within each project
+
+        Returns:
+            QuerySet that sets ``tasks_list`` on every fetched project
+        """
+        clone = self._chain()
+        clone._task_rows = (tuple(fields), tuple(ordering))
+        return clone
+
+    def _fetch_all(self):
+        attach = self._result_cache is None and self._task_rows is not None
+        super()._fetch_all()
+        if attach and self._iterable_class is models.query.ModelIterable:
+            self._attach_task_rows()
+
+    def _attach_task_rows(self):
+        fields, ordering = self._task_rows
+        rows_by_project = {}
+        for project in self._result_cache:
+            project.tasks_list = rows_by_project.setdefault(project.pk, [])
+        if not rows_by_project:
+            return
+
+        rows = (
+            Task.objects.using(self.db)
+            .filter(project__in=list(rows_by_project))
+            .order_by(*ordering)
+            .values_list("project_id", *fields, named=True)
+        )
+        for row in rows:
+            rows_by_project[row.project_id].append(row)
@@ -0,0 +1,69 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# Step 1 of switching Project to a BigAutoField primary key: build the new
+# table alongside the old one and copy every project across, keeping the old
+# UUID primary key as ``public_id`` so existing URLs keep resolving.
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_projects(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    NewProject = apps.get_model("projects", "NewProject")
+    # Insert in creation order so the new sequential ids follow created_at.
+    NewProject.objects.bulk_create(
+        NewProject(
+            public_id=project.id,
+            owner_id=project.owner_id,
+            name=project.name,
+            description=project.description,
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+        )
+        for project in Project.objects.order_by("created_at").iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_owner_created_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewProject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('public_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True)),
+                # Plain DateTimeFields while copying so the original timestamps
+                # are kept; auto_now_add/auto_now are restored below.
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('owner', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Project',
+                'verbose_name_plural': 'Projects',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.RunPython(copy_projects),
+        migrations.AlterField(
+            model_name='newproject',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name='newproject',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# Step 3 of switching Project to a BigAutoField primary key: drop the old
+# UUID-keyed table and move the copy into its place.
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_newproject'),
+        ('tasks', '0003_task_project_new'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='Project',
+        ),
+        migrations.RenameModel(
+            old_name='NewProject',
+            new_name='Project',
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='owner',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='projects', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['owner', '-created_at'], name='project_owner_created_idx'),
+        ),
+    ]
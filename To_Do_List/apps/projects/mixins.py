@@ -1,31 +1,46 @@
 """Mixins for project views."""
 
-from django.db.models import Prefetch
+from django.db.models import prefetch_related_objects
 from django.http import HttpResponse
-from django.template.loader import render_to_string
+
+from apps.utils import cached_template
+
+from .optimizers import optimize_project_qs, tasks_prefetch
 
 
 class ProjectQuerysetMixin:
     """Mixin to provide common queryset logic for project views."""
 
+    # Project attributes read by the rendered template, see optimize_project_qs.
+    # The default matches projects/partials/project_row.html.
+    project_fields = frozenset({"tasks_list"})
+
     def get_project_queryset(self):
-        """Get projects queryset with optimized prefetching."""
-        from apps.tasks.models import Task
-
-        tasks_prefetch = Prefetch(
-            "tasks",
-            queryset=Task.objects.select_related("assigned_to").order_by(
-                "-priority", "deadline", "-created_at"
-            ),
-        )
-        return (
-            self.model.objects.for_user(self.request.user)
-            .select_related("owner")
-            .prefetch_related(tasks_prefetch)
-        )
+        """
+        Get the user's projects optimized for ``project_fields``.
+
+        The queryset is memoized on the request per set of fields, so repeated
+        calls within one request share the same prefetch setup and, once
+        evaluated, its results, while views rendering other templates still
+        get a queryset optimized for theirs.
+        """
+        memo = self.request.__dict__.setdefault("_project_qs", {})
+        fields = frozenset(self.project_fields)
+        projects = memo.get(fields)
+        if projects is None:
+            # No select_related("owner") unless asked for: for_user() already
+            # pins the owner to request.user, so joining the users table would
+            # only refetch it.
+            projects = optimize_project_qs(self.model.objects.for_user(self.request.user), fields)
+            memo[fields] = projects
+        return projects
 
+    def prefetch_project_tasks(self, projects) -> None:
+        """Attach ordered tasks to already loaded projects."""
+        prefetch_related_objects(projects, tasks_prefetch())
 
-class HTMXResponseMixin:
+
+class HTMXResponseMixin(ProjectQuerysetMixin):
     """Mixin to handle HTMX responses consistently."""
 
     def render_htmx_response(
@@ -42,31 +57,46 @@ class HTMXResponseMixin:
         Returns:
             HttpResponse with rendered template and optional HX-Trigger header
         """
-        html = render_to_string(template_name, context, request=self.request)
-        response = HttpResponse(html)
-        if trigger_event:
-            response["HX-Trigger"] = trigger_event
+        html = cached_template(template_name).render(context, self.request)
+        headers = {"HX-Trigger": trigger_event} if trigger_event else None
+        return HttpResponse(html, headers=headers)
+
+    def form_invalid(self, form):
+        """
+        Re-render an invalid form back into the project modal.
+
+        The form posts with ``hx-swap="none"`` because a valid save answers
+        with out-of-band rows only, so the errors are redirected explicitly.
+
+        Args:
+            form: Bound form with errors
+
+        Returns:
+            HttpResponse with the form, retargeted at the modal for HTMX
+        """
+        response = super().form_invalid(form)
+        if self.request.htmx:
+            response["HX-Retarget"] = "#projectModal .modal-content"
+            response["HX-Reswap"] = "innerHTML"
         return response
 
-    def render_projects_list_htmx(self, trigger_event: str) -> HttpResponse:
+    def render_project_row_htmx(
+        self, project, trigger_event: str, swap: str = "outerHTML"
+    ) -> HttpResponse:
         """
-        Render projects list for HTMX response.
+        Render a single project row as an HTMX out-of-band swap.
 
         Args:
+            project: Project instance to render
             trigger_event: HTMX event name to trigger
+            swap: Out-of-band swap strategy; "outerHTML" replaces the existing
+                row, anything else (e.g. "afterbegin:#projects-list") inserts it
 
         Returns:
-            HttpResponse with projects list
+            HttpResponse with the project row fragment
         """
-        from .models import Project
-
-        projects = (
-            Project.objects.for_user(self.request.user)
-            .select_related("owner")
-            .prefetch_related("tasks")
-        )
         return self.render_htmx_response(
-            "projects/partials/projects_all.html",
-            {"projects": projects},
+            "projects/partials/project_row_oob.html",
+            {"project": project, "swap": swap},
             trigger_event=trigger_event,
         )
@@ -3,27 +3,40 @@ import uuid
 from django.conf import settings
 from django.db import models
 
-from .managers import OwnedManager
+from .managers import ProjectQuerySet
 
 
 class Project(models.Model):
-    """Project model that groups related tasks."""
+    """
+    Project model that groups related tasks.
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    Uses a sequential BigAutoField primary key so inserts append to the end of
+    the B-tree and foreign keys stay 8 bytes wide. The random ``public_id`` is
+    what appears in URLs and the DOM.
+    """
+
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     owner = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="projects"
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="projects",
+        db_index=False,  # Covered by the leading column of project_owner_created_idx
     )
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    objects = OwnedManager()
+    objects = ProjectQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Project"
         verbose_name_plural = "Projects"
+        indexes = [
+            # Composite index for for_user() filtering with the default ordering
+            models.Index(fields=["owner", "-created_at"], name="project_owner_created_idx"),
+        ]
 
     def __str__(self):
         return self.name
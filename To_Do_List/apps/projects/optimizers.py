@@ -0,0 +1,61 @@
+"""Declarative queryset optimization for project renders."""
+
+from django.db.models import Count, Prefetch
+
+from apps.tasks.models import Task
+
+# Task columns read by tasks/partials/task_item.html.
+TASK_ROW_FIELDS = ("pk", "short_id", "title", "description", "deadline", "priority", "is_done")
+
+# The same columns for model instances, plus the FK the prefetch needs to
+# attach each task to its project.
+TASK_ITEM_FIELDS = (*TASK_ROW_FIELDS, "project")
+
+TASK_ORDERING = ("-priority", "deadline", "-created_at")
+
+# Unbounded columns loaded only when a template actually reads them.
+DEFERRABLE_FIELDS = ("description",)
+
+
+def tasks_prefetch() -> Prefetch:
+    """Build the ordered tasks prefetch for projects that are already loaded."""
+    return Prefetch(
+        "tasks",
+        queryset=Task.objects.only(*TASK_ITEM_FIELDS).order_by(*TASK_ORDERING),
+        to_attr="tasks_list",
+    )
+
+
+# Maps a project attribute read by a template to the queryset change that
+# loads it without a per-row query.
+PROJECT_FIELD_LOADERS = {
+    "owner": lambda qs: qs.select_related("owner"),
+    # List renders are read-only, so tasks come back as named tuple rows.
+    "tasks_list": lambda qs: qs.with_task_rows(TASK_ROW_FIELDS, TASK_ORDERING),
+    "task_count": lambda qs: qs.annotate(task_count=Count("tasks")),
+}
+
+
+def optimize_project_qs(qs, template_tag_set):
+    """
+    Attach the joins, prefetches and deferrals a template needs.
+
+    Args:
+        qs: Project queryset to optimize
+        template_tag_set: Project attributes the template reads beyond the
+            concrete columns (e.g. {"tasks_list", "description"})
+
+    Returns:
+        Queryset that renders the template without N+1 queries
+    """
+    unknown = set(template_tag_set) - PROJECT_FIELD_LOADERS.keys() - set(DEFERRABLE_FIELDS)
+    if unknown:
+        raise ValueError(f"No loader for project fields: {', '.join(sorted(unknown))}")
+
+    deferred = [field for field in DEFERRABLE_FIELDS if field not in template_tag_set]
+    if deferred:
+        qs = qs.defer(*deferred)
+    for field, loader in PROJECT_FIELD_LOADERS.items():
+        if field in template_tag_set:
+            qs = loader(qs)
+    return qs
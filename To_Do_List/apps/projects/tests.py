@@ -1,8 +1,11 @@
 import pytest
 from django.urls import reverse
+from django.utils import timezone
 
 from apps.projects.forms import ProjectForm
 from apps.projects.models import Project
+from apps.projects.views import ProjectListPartialView, ProjectsAllView
+from apps.tasks.models import Task
 
 
 @pytest.mark.django_db
@@ -27,6 +30,34 @@ class TestProjectModel:
         assert project1 in user_projects
         assert project2 not in user_projects
 
+    def test_project_with_task_rows(self, user):
+        """Test with_task_rows attaches ordered task rows to each project."""
+        project = Project.objects.create(name="Project", owner=user)
+        empty = Project.objects.create(name="Empty", owner=user)
+        Task.objects.create(project=project, title="Low", priority=Task.Priority.LOW)
+        high = Task.objects.create(project=project, title="High", priority=Task.Priority.HIGH)
+
+        projects = {
+            p.pk: p
+            for p in Project.objects.for_user(user).with_task_rows(("pk", "title"), ["-priority"])
+        }
+        assert [row.title for row in projects[project.pk].tasks_list] == ["High", "Low"]
+        assert projects[project.pk].tasks_list[0].pk == high.pk
+        assert projects[empty.pk].tasks_list == []
+
+    def test_project_queryset_memo_keyed_by_fields(self, rf, user):
+        """Test views sharing a request get querysets for their own project_fields."""
+        Project.objects.create(name="Project", owner=user)
+        request = rf.get("/")
+        request.user = user
+        rows_view, partial_view = ProjectsAllView(), ProjectListPartialView()
+        rows_view.request = partial_view.request = request
+
+        rows = rows_view.get_project_queryset()
+        assert rows_view.get_project_queryset() is rows
+        assert partial_view.get_project_queryset() is not rows
+        assert partial_view.get_project_queryset()[0].task_count == 0
+
 
 @pytest.mark.django_db
 class TestProjectViews:
@@ -55,11 +86,26 @@ class TestProjectViews:
 
         assert response.status_code == 200
         assert Project.objects.filter(name="New Project", owner=user).exists()
+        content = response.content.decode()
+        assert 'hx-swap-oob="afterbegin:#projects-list"' in content
+        assert "New Project" in content
+
+    def test_project_create_view_invalid_htmx(self, authenticated_client, user):
+        """Test an invalid HTMX create re-renders the form into the modal."""
+        response = authenticated_client.post(
+            reverse("projects:project_create"), {"name": ""}, **{"HTTP_HX-Request": "true"}
+        )
+
+        assert response.status_code == 200
+        assert response["HX-Retarget"] == "#projectModal .modal-content"
+        assert response["HX-Reswap"] == "innerHTML"
+        assert "invalid-feedback" in response.content.decode()
+        assert not Project.objects.filter(owner=user).exists()
 
     def test_project_update_view(self, authenticated_client, user):
         """Test updating a project."""
         project = Project.objects.create(name="Old Name", owner=user)
-        url = reverse("projects:project_update", kwargs={"pk": project.pk})
+        url = reverse("projects:project_update", kwargs={"public_id": project.public_id})
 
         response = authenticated_client.post(
             url,
@@ -70,21 +116,108 @@ class TestProjectViews:
         assert response.status_code == 200
         project.refresh_from_db()
         assert project.name == "Updated Name"
+        content = response.content.decode()
+        assert f'id="project-{project.public_id}" hx-swap-oob="true"' in content
+        assert "Updated Name" in content
+
+    def test_project_update_view_writes_changed_fields_only(
+        self, authenticated_client, user, django_assert_max_num_queries
+    ):
+        """Test updating a project writes only the edited columns."""
+        project = Project.objects.create(name="Name", description="Description", owner=user)
+        url = reverse("projects:project_update", kwargs={"public_id": project.public_id})
+
+        with django_assert_max_num_queries(10) as captured:
+            authenticated_client.post(url, {"name": "Name", "description": "Description"})
+        assert not [q for q in captured.captured_queries if q["sql"].startswith("UPDATE")]
+
+        with django_assert_max_num_queries(10) as captured:
+            authenticated_client.post(url, {"name": "New Name", "description": "Description"})
+        (update,) = [q for q in captured.captured_queries if q["sql"].startswith("UPDATE")]
+        assert '"description"' not in update["sql"]
+        project.refresh_from_db()
+        assert project.name == "New Name"
 
     def test_project_delete_view(self, authenticated_client, user):
         """Test deleting a project."""
         project = Project.objects.create(name="To Delete", owner=user)
-        url = reverse("projects:project_delete", kwargs={"pk": project.pk})
+        url = reverse("projects:project_delete", kwargs={"public_id": project.public_id})
 
         response = authenticated_client.delete(url, **{"HTTP_HX-Request": "true"})
 
         assert response.status_code == 200
         assert not Project.objects.filter(pk=project.pk).exists()
 
+    def test_cannot_delete_other_user_project(self, authenticated_client, another_user):
+        """Test that user cannot delete another user's project."""
+        project = Project.objects.create(name="Other User Project", owner=another_user)
+        url = reverse("projects:project_delete", kwargs={"public_id": project.public_id})
+
+        response = authenticated_client.delete(url, **{"HTTP_HX-Request": "true"})
+
+        assert response.status_code == 404
+        assert Project.objects.filter(pk=project.pk).exists()
+
+    def test_project_detail_view(self, authenticated_client, user, django_assert_num_queries):
+        """Test project detail renders the project and its tasks."""
+        project = Project.objects.create(name="Detail Project", owner=user)
+        Task.objects.create(project=project, title="Detail Task", assigned_to=user)
+        url = reverse("projects:project_detail", kwargs={"public_id": project.public_id})
+
+        # session, user, cache version, tasks joined with project
+        with django_assert_num_queries(4):
+            response = authenticated_client.get(url)
+        assert response.status_code == 200
+        content = response.content.decode()
+        assert "Detail Project" in content
+        assert "Detail Task" in content
+
+    def test_project_detail_view_cached_until_task_change(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Test project detail is served from cache until its project or tasks change."""
+        project = Project.objects.create(name="Detail Project", owner=user)
+        task = Task.objects.create(project=project, title="Detail Task")
+        url = reverse("projects:project_detail", kwargs={"public_id": project.public_id})
+        authenticated_client.get(url)
+
+        with django_assert_num_queries(3):  # session, user, cache version
+            response = authenticated_client.get(url)
+        assert "task-done" not in response.content.decode()
+
+        authenticated_client.post(reverse("tasks:task_toggle", kwargs={"short_id": task.short_id}))
+        assert "task-done" in authenticated_client.get(url).content.decode()
+
+        # Writes outside the views (admin, shell, other workers) invalidate too.
+        Task.objects.create(project=project, title="Shell Task")
+        assert "Shell Task" in authenticated_client.get(url).content.decode()
+        task.delete()
+        assert "Detail Task" not in authenticated_client.get(url).content.decode()
+        Project.objects.filter(pk=project.pk).update(name="Renamed", updated_at=timezone.now())
+        assert "Renamed" in authenticated_client.get(url).content.decode()
+
+    def test_project_detail_view_empty_project(self, authenticated_client, user):
+        """Test project detail falls back to a project lookup when there are no tasks."""
+        project = Project.objects.create(name="Empty Project", owner=user)
+        url = reverse("projects:project_detail", kwargs={"public_id": project.public_id})
+
+        response = authenticated_client.get(url)
+        assert response.status_code == 200
+        assert "Empty Project" in response.content.decode()
+
+    def test_project_detail_view_other_user(self, authenticated_client, another_user):
+        """Test project detail returns 404 for another user's project."""
+        project = Project.objects.create(name="Other User Project", owner=another_user)
+        Task.objects.create(project=project, title="Hidden Task")
+        url = reverse("projects:project_detail", kwargs={"public_id": project.public_id})
+
+        response = authenticated_client.get(url)
+        assert response.status_code == 404
+
     def test_cannot_access_other_user_project(self, authenticated_client, another_user):
         """Test that user cannot access another user's project."""
         project = Project.objects.create(name="Other User Project", owner=another_user)
-        url = reverse("projects:project_update", kwargs={"pk": project.pk})
+        url = reverse("projects:project_update", kwargs={"public_id": project.public_id})
 
         response = authenticated_client.get(url)
         assert response.status_code == 404
@@ -100,6 +233,60 @@ class TestProjectViews:
         assert "Project 1" in content
         assert "Project 2" in content
 
+    def test_projects_all_view_renders_prefetched_tasks(self, authenticated_client, user):
+        """Test ProjectsAllView renders each project's tasks from the prefetch."""
+        project = Project.objects.create(name="Project 1", owner=user)
+        Task.objects.create(project=project, title="Low Task", priority=Task.Priority.LOW)
+        Task.objects.create(project=project, title="High Task", priority=Task.Priority.HIGH)
+
+        response = authenticated_client.get(reverse("projects:projects_all"))
+        content = response.content.decode()
+        assert content.index("High Task") < content.index("Low Task")
+
+    def test_projects_all_view_cache_invalidated_on_change(self, authenticated_client, user):
+        """Test the cached ProjectsAllView fragment is refreshed when data changes."""
+        project = Project.objects.create(name="Project 1", owner=user)
+        url = reverse("projects:projects_all")
+        assert "Cached Task" not in authenticated_client.get(url).content.decode()
+
+        task = Task.objects.create(project=project, title="Cached Task")
+        assert "Cached Task" in authenticated_client.get(url).content.decode()
+
+        task.is_done = True
+        task.save(update_fields=["is_done", "updated_at"])
+        assert "task-done" in authenticated_client.get(url).content.decode()
+
+    def test_projects_all_view_etag(self, authenticated_client, user):
+        """Test ProjectsAllView answers 304 until the user's projects change."""
+        project = Project.objects.create(name="Project 1", owner=user)
+        url = reverse("projects:projects_all")
+        response = authenticated_client.get(url)
+        etag = response["ETag"]
+        assert "HX-Request" in response["Vary"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+        project.name = "Renamed"
+        project.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_project_list_partial_view_task_count(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Test the sidebar partial renders task counts without a query per project."""
+        for name in ("Project 1", "Project 2"):
+            project = Project.objects.create(name=name, owner=user, description="About it")
+            Task.objects.create(project=project, title="Task")
+
+        with django_assert_num_queries(3):  # session, user, annotated projects
+            response = authenticated_client.get(reverse("projects:project_list_partial"))
+        content = response.content.decode()
+        assert "About it" in content
+        assert '<small class="text-muted">1</small>' in content
+
 
 @pytest.mark.django_db
 class TestProjectForm:
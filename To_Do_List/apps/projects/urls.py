@@ -10,7 +10,7 @@ urlpatterns = [
     path("all/", views.ProjectsAllView.as_view(), name="projects_all"),
     path("partial/", views.ProjectListPartialView.as_view(), name="project_list_partial"),
     path("create/", views.ProjectCreateView.as_view(), name="project_create"),
-    path("<uuid:pk>/", views.ProjectDetailView.as_view(), name="project_detail"),
-    path("<uuid:pk>/update/", views.ProjectUpdateView.as_view(), name="project_update"),
-    path("<uuid:pk>/delete/", views.ProjectDeleteView.as_view(), name="project_delete"),
+    path("<uuid:public_id>/", views.ProjectDetailView.as_view(), name="project_detail"),
+    path("<uuid:public_id>/update/", views.ProjectUpdateView.as_view(), name="project_update"),
+    path("<uuid:public_id>/delete/", views.project_delete, name="project_delete"),
 ]
@@ -1,51 +1,104 @@
-from typing import TYPE_CHECKING
-
+from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
-from django.views.generic import CreateView, DeleteView, ListView, UpdateView
-
+from django.utils.cache import get_conditional_response
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_http_methods
+from django.views.decorators.vary import vary_on_headers
+from django.views.generic import CreateView, ListView, UpdateView, View
+
+from apps.tasks.models import Task
+from apps.utils import cached_template
+
+from .cache import (
+    PROJECT_DETAIL_CACHE_TIMEOUT,
+    PROJECTS_ALL_CACHE_TIMEOUT,
+    project_detail_cache_key,
+    projects_all_cache_key,
+    projects_all_etag,
+)
 from .forms import ProjectForm
 from .mixins import HTMXResponseMixin, ProjectQuerysetMixin
 from .models import Project
 
-if TYPE_CHECKING:
-    pass
-else:
-    from apps.tasks.models import Task
 
+@method_decorator(login_required, name="get")
+class BaseProjectListView(ProjectQuerysetMixin, View):
+    """
+    Async base view rendering the user's projects into ``template_name``.
 
-class ProjectListView(LoginRequiredMixin, ProjectQuerysetMixin, ListView):
-    """Display list of projects for the authenticated user."""
+    Subclasses declare the project attributes their template reads in
+    ``project_fields``; the queryset is optimized from that declaration.
+    Projects are intentionally unpaginated, so no COUNT(*) query is issued.
+    """
 
     model = Project
-    context_object_name = "projects"
-    template_name = "projects/project_list.html"
+    template_name: str
 
-    def get_queryset(self):
-        return self.get_project_queryset()
+    async def get(self, request, *args, **kwargs):
+        # Resolve the user on the event loop so neither the queryset nor the
+        # template has to load it synchronously.
+        request.user = await request.auser()
+        return HttpResponse(await self.render_projects())
 
+    async def get_projects(self) -> list:
+        """Materialize the optimized project queryset."""
+        return [project async for project in self.get_project_queryset()]
 
-class ProjectsAllView(LoginRequiredMixin, ProjectQuerysetMixin, ListView):
-    """Partial view for HTMX to load all projects with tasks."""
+    async def render_projects(self) -> str:
+        """Render ``template_name`` with the user's projects."""
+        projects = await self.get_projects()
+        return cached_template(self.template_name).render({"projects": projects}, self.request)
 
-    model = Project
-    context_object_name = "projects"
-    template_name = "projects/partials/projects_all.html"
 
-    def get_queryset(self):
-        return self.get_project_queryset()
+class ProjectListView(BaseProjectListView):
+    """Display list of projects for the authenticated user."""
+
+    template_name = "projects/project_list.html"
+
+    async def get_projects(self) -> list:
+        # The page shell loads its projects from ProjectsAllView via hx-get.
+        return []
+
 
+@method_decorator(
+    [login_required, vary_on_headers("HX-Request"), cache_control(private=True, no_cache=True)],
+    name="get",
+)
+class ProjectsAllView(BaseProjectListView):
+    """
+    Partial view for HTMX to load all projects with tasks.
 
-class ProjectListPartialView(LoginRequiredMixin, ListView):
+    The rendered fragment is cached per user. The cache key embeds a version
+    of the user's projects and tasks, so any mutation invalidates it implicitly.
+    The same key backs the ETag, so an unchanged fragment is answered with 304.
+    """
+
+    template_name = "projects/partials/projects_all.html"
+
+    async def get(self, request, *args, **kwargs):
+        request.user = await request.auser()
+        cache_key = await projects_all_cache_key(request, request.user)
+        etag = projects_all_etag(cache_key)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            content = await cache.aget(cache_key)
+            if content is None:
+                content = await self.render_projects()
+                await cache.aset(cache_key, content, PROJECTS_ALL_CACHE_TIMEOUT)
+            response = HttpResponse(content)
+        response["ETag"] = etag
+        return response
+
+
+class ProjectListPartialView(BaseProjectListView):
     """Partial view for HTMX to load projects in sidebar."""
 
-    model = Project
-    context_object_name = "projects"
     template_name = "projects/partials/project_list_partial.html"
-
-    def get_queryset(self):
-        return Project.objects.for_user(self.request.user).select_related("owner")
+    project_fields = frozenset({"description", "task_count"})
 
 
 class ProjectCreateView(LoginRequiredMixin, HTMXResponseMixin, CreateView):
@@ -67,7 +120,8 @@ class ProjectCreateView(LoginRequiredMixin, HTMXResponseMixin, CreateView):
         Sets the current user as the project owner and saves the project.
 
         For HTMX requests:
-            - Returns an HTML fragment with updated projects list
+            - Returns the new project row as an out-of-band fragment that is
+              prepended to the projects list
             - Adds HX-Trigger header to notify client of successful creation
             - Client can listen to 'projectCreated' event for UI updates
 
@@ -84,7 +138,11 @@ class ProjectCreateView(LoginRequiredMixin, HTMXResponseMixin, CreateView):
         self.object = form.save()
 
         if self.request.htmx:
-            return self.render_projects_list_htmx("projectCreated")
+            # A new project has no tasks yet, so skip querying for them.
+            self.object.tasks_list = []
+            return self.render_project_row_htmx(
+                self.object, "projectCreated", swap="afterbegin:#projects-list"
+            )
 
         return redirect("projects:project_list")
 
@@ -95,6 +153,8 @@ class ProjectUpdateView(LoginRequiredMixin, HTMXResponseMixin, UpdateView):
     model = Project
     form_class = ProjectForm
     template_name = "projects/partials/project_form.html"
+    slug_field = "public_id"
+    slug_url_kwarg = "public_id"
 
     def get_queryset(self):
         return Project.objects.for_user(self.request.user)
@@ -105,26 +165,42 @@ class ProjectUpdateView(LoginRequiredMixin, HTMXResponseMixin, UpdateView):
         return context
 
     def form_valid(self, form):
-        self.object = form.save()
+        self.object = form.save(commit=False)
+        # Write only the edited columns; an unchanged form writes nothing.
+        if form.changed_data:
+            self.object.save(update_fields=[*form.changed_data, "updated_at"])
         if self.request.htmx:
-            return self.render_projects_list_htmx("projectUpdated")
-        return redirect("projects:project_detail", pk=self.object.pk)
+            self.prefetch_project_tasks([self.object])
+            return self.render_project_row_htmx(self.object, "projectUpdated")
+        return redirect("projects:project_detail", public_id=self.object.public_id)
 
 
-class ProjectDeleteView(LoginRequiredMixin, DeleteView):
-    """Delete a project."""
+@login_required
+@require_http_methods(["POST", "DELETE"])
+async def project_delete(request, public_id):
+    """
+    Delete a project using the async ORM.
 
-    model = Project
+    HTMX fires deletes without waiting on the result, so the view runs on the
+    event loop instead of holding a worker thread for the database round-trips.
 
-    def get_queryset(self):
-        return Project.objects.for_user(self.request.user)
+    Args:
+        request: Incoming request
+        public_id: Public UUID of the project to delete
 
-    def delete(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.delete()
-        if request.htmx:
-            return HttpResponse("")
-        return redirect("projects:project_list")
+    Returns:
+        HttpResponse: Empty body for HTMX, or HttpResponseRedirect
+
+    Raises:
+        Http404: If the project does not exist or belongs to another user
+    """
+    user = await request.auser()
+    deleted, _ = await Project.objects.for_user(user).filter(public_id=public_id).adelete()
+    if not deleted:
+        raise Http404("No project found matching the query")
+    if request.htmx:
+        return HttpResponse("")
+    return redirect("projects:project_list")
 
 
 class ProjectDetailView(LoginRequiredMixin, ListView):
@@ -133,12 +209,40 @@ class ProjectDetailView(LoginRequiredMixin, ListView):
     model = Task
     context_object_name = "tasks"
     template_name = "projects/partials/project_detail.html"
+    # Intentionally unpaginated, like the project list views: a Paginator would
+    # add a SELECT COUNT(*) to every render. If paging is ever needed, slice a
+    # page_size + 1 window to detect the next page rather than counting.
+    paginate_by = None
+
+    def get(self, request, *args, **kwargs):
+        # The cache key is versioned by the project's rows themselves, so any
+        # change moves to a new key and entries never need to be deleted.
+        cache_key = project_detail_cache_key(request.user, kwargs["public_id"])
+        content = cache.get(cache_key)
+        if content is None:
+            content = super().get(request, *args, **kwargs).render().content
+            cache.set(cache_key, content, PROJECT_DETAIL_CACHE_TIMEOUT)
+        return HttpResponse(content)
 
     def get_queryset(self):
-        self.project = get_object_or_404(
-            Project.objects.for_user(self.request.user), pk=self.kwargs["pk"]
+        # Fetch the tasks with their project joined in, so a project with tasks
+        # costs one round-trip; only an empty project needs a second lookup.
+        # assigned_to is not rendered, so it is not joined.
+        tasks = list(
+            Task.objects.filter(
+                project__public_id=self.kwargs["public_id"], project__owner=self.request.user
+            ).select_related("project")
         )
-        return Task.objects.filter(project=self.project).select_related("project", "assigned_to")
+        if tasks:
+            self.project = tasks[0].project
+        else:
+            self.project = get_object_or_404(
+                Project.objects.for_user(self.request.user).only(
+                    "id", "public_id", "name", "description"
+                ),
+                public_id=self.kwargs["public_id"],
+            )
+        return tasks
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# Step 2 of switching Project to a BigAutoField primary key: point every task
+# at the copied project row and drop the UUID foreign key.
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def repoint_tasks(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    NewProject = apps.get_model("projects", "NewProject")
+    Task.objects.update(
+        project_new=Subquery(
+            NewProject.objects.filter(public_id=OuterRef("project_id")).values("pk")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_newproject'),
+        ('tasks', '0002_add_performance_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_task_project_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='project_new',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='projects.newproject'),
+        ),
+        migrations.RunPython(repoint_tasks),
+        migrations.RemoveField(
+            model_name='task',
+            name='project',
+        ),
+    ]
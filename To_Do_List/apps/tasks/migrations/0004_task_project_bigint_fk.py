@@ -0,0 +1,32 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# Step 4 of switching Project to a BigAutoField primary key: restore the
+# ``project`` foreign key, now an 8-byte bigint column.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_project_bigint_pk'),
+        ('tasks', '0003_task_project_new'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='task',
+            old_name='project_new',
+            new_name='project',
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='project',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tasks', to='projects.project'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['project', 'is_done'], name='tasks_task_project_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_project_bigint_fk'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_task_project_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['project', '-priority', 'deadline', '-created_at'],
+                name='task_project_order_idx',
+            ),
+        ),
+    ]
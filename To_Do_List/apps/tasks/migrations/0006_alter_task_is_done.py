@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_task_project_order_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='is_done',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-15
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_task_updated_at_default'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_task_priorit_idx',
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# On PostgreSQL the column defaults to nextval() of a dedicated sequence, so
+# adding it numbers the existing rows too. The sequence is created first and
+# handed to the column afterwards, which lets DROP COLUMN take it along.
+# SQLite has no sequences and uses the random fallback of SequenceNextval.
+
+import apps.utils
+from django.db import migrations, models
+
+SEQUENCE = "task_short_id_seq"
+
+
+def create_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f'CREATE SEQUENCE IF NOT EXISTS "{SEQUENCE}" AS bigint')
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f'DROP SEQUENCE IF EXISTS "{SEQUENCE}"')
+
+
+def own_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f'ALTER SEQUENCE "{SEQUENCE}" OWNED BY "tasks_task"."short_id"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_drop_global_priority_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_sequence, drop_sequence),
+        migrations.AddField(
+            model_name='task',
+            name='short_id',
+            field=models.BigIntegerField(db_default=apps.utils.SequenceNextval('task_short_id_seq'), editable=False, unique=True),
+        ),
+        migrations.RunPython(own_sequence, migrations.RunPython.noop),
+    ]
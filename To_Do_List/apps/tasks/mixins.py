@@ -1,7 +1,8 @@
 """Mixins for task views."""
 
 from django.http import HttpResponse
-from django.template.loader import render_to_string
+
+from apps.utils import cached_template
 
 
 class TaskHTMXMixin:
@@ -21,13 +22,11 @@ class TaskHTMXMixin:
         Returns:
             HttpResponse with task item HTML
         """
-        html = render_to_string(
-            "tasks/partials/task_item.html", {"task": task}, request=self.request
-        )
-        response = HttpResponse(html)
+        html = cached_template("tasks/partials/task_item.html").render({"task": task}, self.request)
+        headers = {}
         if trigger_event:
-            response["HX-Trigger"] = trigger_event
+            headers["HX-Trigger"] = trigger_event
         if retarget:
-            response["HX-Retarget"] = retarget
-            response["HX-Reswap"] = "outerHTML"
-        return response
+            headers["HX-Retarget"] = retarget
+            headers["HX-Reswap"] = "outerHTML"
+        return HttpResponse(html, headers=headers)
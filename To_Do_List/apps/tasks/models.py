@@ -1,7 +1,8 @@
-import uuid
-
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+from apps.utils import SequenceNextval, uuid7
 
 
 class Task(models.Model):
@@ -13,7 +14,8 @@ class Task(models.Model):
     ordered by priority (high to low), then deadline (soonest first).
 
     Attributes:
-        id: UUID primary key for better security and distributed systems
+        id: Time-ordered UUIDv7 primary key, so inserts append to the index
+        short_id: Sequential 64-bit identifier used in task URLs
         project: Parent project (cascade delete)
         title: Task name/description
         description: Optional detailed description
@@ -32,24 +34,25 @@ class Task(models.Model):
         MEDIUM = 2, "Medium"
         HIGH = 3, "High"
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    project = models.ForeignKey("projects.Project", on_delete=models.CASCADE, related_name="tasks")
-    title = models.CharField(max_length=255)
-    description = models.TextField(blank=True)
-    deadline = models.DateTimeField(
-        null=True,
-        blank=True,
-        db_index=True,  # Indexed for ordering and filtering by deadline
-    )
-    priority = models.IntegerField(
-        choices=Priority.choices,
-        default=Priority.MEDIUM,
-        db_index=True,  # Indexed for ordering and filtering by priority
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # URLs carry this instead of the UUID. Every task lookup is also filtered
+    # by owner, so sequential values don't let one user reach another user's
+    # tasks.
+    short_id = models.BigIntegerField(
+        unique=True, db_default=SequenceNextval("task_short_id_seq"), editable=False
     )
-    is_done = models.BooleanField(
-        default=False,
-        db_index=True,  # Indexed for filtering completed/incomplete tasks
+    project = models.ForeignKey(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        related_name="tasks",
+        db_index=False,  # Covered by the leading column of task_project_order_idx
     )
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+    # Ordering by priority and deadline is served by the composite index below
+    deadline = models.DateTimeField(null=True, blank=True)
+    priority = models.IntegerField(choices=Priority.choices, default=Priority.MEDIUM)
+    is_done = models.BooleanField(default=False)
     assigned_to = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -58,18 +61,29 @@ class Task(models.Model):
         related_name="assigned_tasks",
     )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    # Stamped in save() instead of auto_now; see save()
+    updated_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         ordering = ["-priority", "deadline", "-created_at"]
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
         indexes = [
-            # Composite index for the default ordering (priority desc, deadline asc)
-            models.Index(fields=["-priority", "deadline"]),
-            # Index for filtering tasks by project and completion status
-            models.Index(fields=["project", "is_done"]),
+            # Per-project task lists: equality on project, then the full default
+            # ordering, so rows come back pre-sorted without a separate sort step
+            models.Index(
+                fields=["project", "-priority", "deadline", "-created_at"],
+                name="task_project_order_idx",
+            ),
         ]
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        # Only touch updated_at when it is actually being written, so narrow
+        # saves skip the timestamp instead of setting it and discarding it.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "updated_at" in update_fields:
+            self.updated_at = timezone.now()
+        super().save(*args, **kwargs)
@@ -1,3 +1,4 @@
+import time
 from datetime import timedelta
 
 import pytest
@@ -32,6 +33,36 @@ class TestTaskModel:
         task = Task.objects.create(project=project, title="Test Task")
         assert task.priority == Task.Priority.MEDIUM
 
+    def test_task_ids_are_time_ordered(self, user):
+        """Test task primary keys are UUIDv7 and sort by creation time."""
+        project = Project.objects.create(name="Test Project", owner=user)
+        first = Task.objects.create(project=project, title="First")
+        time.sleep(0.002)
+        second = Task.objects.create(project=project, title="Second")
+        assert first.pk.version == 7
+        assert first.pk < second.pk
+
+    def test_task_short_id_assigned_by_database(self, user):
+        """Test short_id is filled in by the database default on insert."""
+        project = Project.objects.create(name="Test Project", owner=user)
+        first = Task.objects.create(project=project, title="First")
+        second = Task.objects.create(project=project, title="Second")
+        assert isinstance(first.short_id, int)
+        assert first.short_id != second.short_id
+        assert Task.objects.get(short_id=first.short_id) == first
+
+    def test_task_updated_at_stamped_only_when_written(self, user):
+        """Test updated_at is refreshed by full saves and by update_fields naming it."""
+        project = Project.objects.create(name="Test Project", owner=user)
+        task = Task.objects.create(project=project, title="Test Task")
+        created = task.updated_at
+
+        task.save(update_fields=["title"])
+        assert task.updated_at == created
+
+        task.save(update_fields=["is_done", "updated_at"])
+        assert task.updated_at > created
+
     def test_task_is_done_default(self, user):
         """Test task is_done defaults to False."""
         project = Project.objects.create(name="Test Project", owner=user)
@@ -96,21 +127,45 @@ class TestTaskViews:
     def test_task_create_view_inline(self, authenticated_client, user):
         """Test creating a task via inline form."""
         project = Project.objects.create(name="Test Project", owner=user)
-        url = reverse("tasks:task_create", kwargs={"project_pk": project.pk})
+        url = reverse("tasks:task_create", kwargs={"project_public_id": project.public_id})
 
         response = authenticated_client.post(
-            url, {"title": "New Task", "csrfmiddlewaretoken": "test"}, **{"HTTP_HX-Request": "true"}
+            url, {"title": "New Task", "_inline": "1"}, **{"HTTP_HX-Request": "true"}
         )
 
         assert response.status_code == 200
         assert Task.objects.filter(title="New Task", project=project).exists()
+        assert "New Task" in response.content.decode()
+
+    def test_task_create_view_loads_project_key_only(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Test creating a task checks the project by its key without loading the row."""
+        project = Project.objects.create(name="Test Project", owner=user)
+        url = reverse("tasks:task_create", kwargs={"project_public_id": project.public_id})
+
+        with django_assert_num_queries(4) as captured:  # session, user, project key, INSERT
+            authenticated_client.post(
+                url, {"title": "New Task", "_inline": "1"}, **{"HTTP_HX-Request": "true"}
+            )
+        assert '"name"' not in captured.captured_queries[2]["sql"]
+        assert Task.objects.get(title="New Task").project_id == project.pk
+
+    def test_cannot_create_task_in_other_user_project(self, authenticated_client, another_user):
+        """Test that user cannot add a task to another user's project."""
+        project = Project.objects.create(name="Other User Project", owner=another_user)
+        url = reverse("tasks:task_create", kwargs={"project_public_id": project.public_id})
+
+        response = authenticated_client.post(url, {"title": "Intruder", "_inline": "1"})
+        assert response.status_code == 404
+        assert not Task.objects.filter(title="Intruder").exists()
 
     def test_task_update_view(self, authenticated_client, user):
         """Test updating a task."""
         project = Project.objects.create(name="Test Project", owner=user)
         task = Task.objects.create(project=project, title="Old Title", priority=Task.Priority.LOW)
 
-        url = reverse("tasks:task_update", kwargs={"pk": task.pk})
+        url = reverse("tasks:task_update", kwargs={"short_id": task.short_id})
         future_date = timezone.now() + timedelta(days=1)
 
         response = authenticated_client.post(
@@ -133,18 +188,44 @@ class TestTaskViews:
         project = Project.objects.create(name="Test Project", owner=user)
         task = Task.objects.create(project=project, title="To Delete")
 
-        url = reverse("tasks:task_delete", kwargs={"pk": task.pk})
+        url = reverse("tasks:task_delete", kwargs={"short_id": task.short_id})
         response = authenticated_client.delete(url, **{"HTTP_HX-Request": "true"})
 
         assert response.status_code == 200
         assert not Task.objects.filter(pk=task.pk).exists()
 
+    def test_task_delete_view_redirects_without_htmx(self, authenticated_client, user):
+        """Test deleting a task without HTMX redirects to its project."""
+        project = Project.objects.create(name="Test Project", owner=user)
+        task = Task.objects.create(project=project, title="To Delete")
+
+        response = authenticated_client.post(
+            reverse("tasks:task_delete", kwargs={"short_id": task.short_id})
+        )
+
+        assert response.status_code == 302
+        assert response.url == reverse(
+            "projects:project_detail", kwargs={"public_id": project.public_id}
+        )
+        assert not Task.objects.filter(pk=task.pk).exists()
+
+    def test_cannot_delete_other_user_task(self, authenticated_client, another_user):
+        """Test that user cannot delete another user's task."""
+        project = Project.objects.create(name="Other User Project", owner=another_user)
+        task = Task.objects.create(project=project, title="Other User Task")
+
+        url = reverse("tasks:task_delete", kwargs={"short_id": task.short_id})
+        response = authenticated_client.delete(url, **{"HTTP_HX-Request": "true"})
+
+        assert response.status_code == 404
+        assert Task.objects.filter(pk=task.pk).exists()
+
     def test_task_toggle_view(self, authenticated_client, user):
         """Test toggling task completion."""
         project = Project.objects.create(name="Test Project", owner=user)
         task = Task.objects.create(project=project, title="Test Task", is_done=False)
 
-        url = reverse("tasks:task_toggle", kwargs={"pk": task.pk})
+        url = reverse("tasks:task_toggle", kwargs={"short_id": task.short_id})
         response = authenticated_client.post(
             url, {"is_done": "true"}, **{"HTTP_HX-Request": "true"}
         )
@@ -153,19 +234,45 @@ class TestTaskViews:
         task.refresh_from_db()
         assert task.is_done is True
 
+    def test_task_toggle_view_single_update(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Test toggling flips the flag back and forth without loading the task first."""
+        project = Project.objects.create(name="Test Project", owner=user)
+        task = Task.objects.create(project=project, title="Test Task", is_done=True)
+        url = reverse("tasks:task_toggle", kwargs={"short_id": task.short_id})
+
+        with django_assert_num_queries(4):  # session, user, UPDATE, narrow reload
+            response = authenticated_client.post(url, **{"HTTP_HX-Request": "true"})
+        assert "Test Task" in response.content.decode()
+        task.refresh_from_db()
+        assert task.is_done is False
+
+    def test_cannot_toggle_other_user_task(self, authenticated_client, another_user):
+        """Test that user cannot toggle another user's task."""
+        project = Project.objects.create(name="Other User Project", owner=another_user)
+        task = Task.objects.create(project=project, title="Other User Task")
+
+        response = authenticated_client.post(
+            reverse("tasks:task_toggle", kwargs={"short_id": task.short_id})
+        )
+        assert response.status_code == 404
+        task.refresh_from_db()
+        assert task.is_done is False
+
     def test_cannot_access_other_user_task(self, authenticated_client, another_user):
         """Test that user cannot access another user's task."""
         project = Project.objects.create(name="Other User Project", owner=another_user)
         task = Task.objects.create(project=project, title="Other User Task")
 
-        url = reverse("tasks:task_update", kwargs={"pk": task.pk})
+        url = reverse("tasks:task_update", kwargs={"short_id": task.short_id})
         response = authenticated_client.get(url)
         assert response.status_code == 404
 
     def test_task_create_full_form(self, authenticated_client, user):
         """Test creating task with full form modal."""
         project = Project.objects.create(name="Test Project", owner=user)
-        url = reverse("tasks:task_create", kwargs={"project_pk": project.pk})
+        url = reverse("tasks:task_create", kwargs={"project_public_id": project.public_id})
         future_date = timezone.now() + timedelta(days=1)
 
         response = authenticated_client.post(
@@ -5,8 +5,8 @@ from . import views
 app_name = "tasks"
 
 urlpatterns = [
-    path("<uuid:project_pk>/create/", views.TaskCreateView.as_view(), name="task_create"),
-    path("<uuid:pk>/update/", views.TaskUpdateView.as_view(), name="task_update"),
-    path("<uuid:pk>/delete/", views.TaskDeleteView.as_view(), name="task_delete"),
-    path("<uuid:pk>/toggle/", views.TaskToggleView.as_view(), name="task_toggle"),
+    path("<uuid:project_public_id>/create/", views.TaskCreateView.as_view(), name="task_create"),
+    path("<int:short_id>/update/", views.TaskUpdateView.as_view(), name="task_update"),
+    path("<int:short_id>/delete/", views.TaskDeleteView.as_view(), name="task_delete"),
+    path("<int:short_id>/toggle/", views.TaskToggleView.as_view(), name="task_toggle"),
 ]
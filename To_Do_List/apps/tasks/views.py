@@ -1,8 +1,10 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse
-from django.shortcuts import get_object_or_404, redirect
-from django.urls import reverse_lazy
-from django.views.generic import CreateView, DeleteView, UpdateView
+from django.db.models import BooleanField, Case, Value, When
+from django.http import Http404, HttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils import timezone
+from django.views.generic import CreateView, UpdateView, View
 
 from apps.projects.models import Project
 
@@ -19,17 +21,23 @@ class TaskCreateView(LoginRequiredMixin, TaskHTMXMixin, CreateView):
     template_name = "tasks/partials/task_form.html"
 
     def dispatch(self, request, *args, **kwargs):
-        self.project = get_object_or_404(
-            Project.objects.for_user(request.user), pk=kwargs["project_pk"]
+        # Only the internal key is needed to attach the task, so fetch just
+        # that instead of the whole project row.
+        self.project_id = (
+            Project.objects.for_user(request.user)
+            .filter(public_id=kwargs["project_public_id"])
+            .values_list("pk", flat=True)
+            .first()
         )
+        if self.project_id is None:
+            raise Http404("No project found matching the query")
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form):
-        form.instance.project = self.project
+        form.instance.project_id = self.project_id
 
-        # Handle simple title-only creation from inline form
-        if self.request.htmx and "title" in self.request.POST and len(self.request.POST) <= 3:
-            # Simple inline creation
+        # Handle simple title-only creation from the inline form
+        if self.request.htmx and self.request.POST.get("_inline") == "1":
             task = form.save()
             return self.render_task_item_htmx(task)
 
@@ -40,10 +48,16 @@ class TaskCreateView(LoginRequiredMixin, TaskHTMXMixin, CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["project"] = self.project
+        # task_form.html only reads the public id, which the URL already holds.
+        context["project"] = Project(pk=self.project_id, public_id=self.kwargs["project_public_id"])
         context["is_update"] = False
         return context
 
+    def get_success_url(self):
+        return reverse(
+            "projects:project_detail", kwargs={"public_id": self.kwargs["project_public_id"]}
+        )
+
 
 class TaskUpdateView(LoginRequiredMixin, TaskHTMXMixin, UpdateView):
     """Update an existing task."""
@@ -51,6 +65,7 @@ class TaskUpdateView(LoginRequiredMixin, TaskHTMXMixin, UpdateView):
     model = Task
     form_class = TaskForm
     template_name = "tasks/partials/task_form.html"
+    slug_field = slug_url_kwarg = "short_id"
 
     def get_queryset(self):
         return Task.objects.filter(project__owner=self.request.user).select_related("project")
@@ -69,44 +84,71 @@ class TaskUpdateView(LoginRequiredMixin, TaskHTMXMixin, UpdateView):
         return super().form_valid(form)
 
     def get_success_url(self):
-        return reverse_lazy("projects:project_detail", kwargs={"pk": self.object.project.pk})
+        return reverse(
+            "projects:project_detail", kwargs={"public_id": self.object.project.public_id}
+        )
 
 
-class TaskDeleteView(LoginRequiredMixin, DeleteView):
+class TaskDeleteView(LoginRequiredMixin, View):
     """Delete a task."""
 
-    model = Task
-
-    def get_queryset(self):
-        return Task.objects.filter(project__owner=self.request.user).select_related("project")
+    http_method_names = ["post", "delete"]
 
     def delete(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.delete()
+        # Delete through a filtered queryset rather than loading the task first.
+        tasks = Task.objects.filter(short_id=kwargs["short_id"], project__owner=request.user)
         if request.htmx:
+            deleted, _ = tasks.delete()
+            if not deleted:
+                raise Http404("No task found matching the query")
             return HttpResponse("")
-        return super().delete(request, *args, **kwargs)
-
-    def get_success_url(self):
-        return reverse_lazy("projects:project_detail", kwargs={"pk": self.object.project.pk})
 
+        project_public_id = tasks.values_list("project__public_id", flat=True).first()
+        if project_public_id is None:
+            raise Http404("No task found matching the query")
+        tasks.delete()
+        return redirect("projects:project_detail", public_id=project_public_id)
 
-class TaskToggleView(LoginRequiredMixin, TaskHTMXMixin, UpdateView):
-    """Toggle task completion status."""
+    post = delete
 
-    model = Task
 
-    def get_queryset(self):
-        return Task.objects.filter(project__owner=self.request.user).select_related(
-            "project", "assigned_to"
-        )
+class TaskToggleView(LoginRequiredMixin, TaskHTMXMixin, View):
+    """Toggle task completion status."""
 
     def post(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.is_done = not self.object.is_done
-        self.object.save(update_fields=["is_done"])
+        # Flip the flag in a single UPDATE instead of loading the task first.
+        # .update() skips Task.save(), so updated_at is set explicitly.
+        tasks = Task.objects.filter(short_id=kwargs["short_id"], project__owner=request.user)
+        updated = tasks.update(
+            is_done=Case(
+                When(is_done=True, then=Value(False)),
+                default=Value(True),
+                output_field=BooleanField(),
+            ),
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            raise Http404("No task found matching the query")
+
+        # Reload only what task_item.html and the redirect read, through the
+        # same owner-scoped queryset; the task may be gone by now.
+        self.object = (
+            tasks.select_related("project")
+            .only(
+                "short_id",
+                "title",
+                "description",
+                "deadline",
+                "priority",
+                "is_done",
+                "project__public_id",
+            )
+            .first()
+        )
+        if self.object is None:
+            raise Http404("No task found matching the query")
 
         if request.htmx:
             return self.render_task_item_htmx(self.object)
 
-        return redirect("projects:project_detail", pk=self.object.project.pk)
+        return redirect("projects:project_detail", public_id=self.object.project.public_id)
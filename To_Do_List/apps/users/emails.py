@@ -1,72 +1,93 @@
 """Email utilities for user authentication and notifications."""
 
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+from django.core.mail import EmailMultiAlternatives, get_connection
 
+from apps.utils import cached_template
 
-def send_welcome_email(user_email: str, username: str) -> None:
-    """Send welcome email to newly registered user."""
-    subject = "Welcome to Todo List!"
-    html_message = render_to_string(
-        "emails/welcome.html",
-        {
-            "username": username,
-            "site_name": "Todo List",
-        },
-    )
-    plain_message = strip_tags(html_message)
+SITE_NAME = "Todo List"
+
+
+def build_email(
+    template_name: str, context: dict, subject: str, user_email: str
+) -> EmailMultiAlternatives:
+    """
+    Render a templated email with a plain-text body and an HTML alternative.
+
+    Args:
+        template_name: Template name under ``emails/`` without extension; the
+            ``.txt`` and ``.html`` variants are rendered from the same context
+        context: Context data for the template
+        subject: Email subject line
+        user_email: Recipient address
 
-    send_mail(
+    Returns:
+        EmailMultiAlternatives ready to be sent
+    """
+    context = {**context, "site_name": SITE_NAME}
+    message = EmailMultiAlternatives(
         subject=subject,
-        message=plain_message,
+        body=cached_template(f"{template_name}.txt").render(context),
         from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user_email],
-        html_message=html_message,
-        fail_silently=False,
+        to=[user_email],
     )
+    message.attach_alternative(
+        cached_template(f"{template_name}.html").render(context), "text/html"
+    )
+    return message
 
 
-def send_verification_email(user_email: str, verification_url: str) -> None:
-    """Send email verification link to user."""
-    subject = "Verify your email address"
-    html_message = render_to_string(
-        "emails/email_verification.html",
-        {
-            "verification_url": verification_url,
-            "site_name": "Todo List",
-        },
+def send_emails(messages) -> int:
+    """
+    Send emails over a single connection instead of opening one per message.
+
+    Args:
+        messages: Iterable of messages built by ``build_email``
+
+    Returns:
+        int: Number of messages sent
+    """
+    with get_connection() as connection:
+        return connection.send_messages(list(messages))
+
+
+def send_welcome_email(user_email: str, username: str) -> None:
+    """Send welcome email to newly registered user."""
+    send_emails(
+        [
+            build_email(
+                "emails/welcome",
+                {"username": username},
+                "Welcome to Todo List!",
+                user_email,
+            )
+        ]
     )
-    plain_message = strip_tags(html_message)
 
-    send_mail(
-        subject=subject,
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user_email],
-        html_message=html_message,
-        fail_silently=False,
+
+def send_verification_email(user_email: str, verification_url: str) -> None:
+    """Send email verification link to user."""
+    send_emails(
+        [
+            build_email(
+                "emails/email_verification",
+                {"verification_url": verification_url},
+                "Verify your email address",
+                user_email,
+            )
+        ]
     )
 
 
 def send_password_reset_email(user_email: str, reset_url: str) -> None:
     """Send password reset link to user."""
-    subject = "Reset your password"
-    html_message = render_to_string(
-        "emails/password_reset.html",
-        {
-            "reset_url": reset_url,
-            "site_name": "Todo List",
-        },
-    )
-    plain_message = strip_tags(html_message)
-
-    send_mail(
-        subject=subject,
-        message=plain_message,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user_email],
-        html_message=html_message,
-        fail_silently=False,
+    send_emails(
+        [
+            build_email(
+                "emails/password_reset",
+                {"reset_url": reset_url},
+                "Reset your password",
+                user_email,
+            )
+        ]
     )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-15
+
+import apps.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_options_alter_user_managers_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.UUIDField(default=apps.utils.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# Trigram indexes for the admin's search_fields. On PostgreSQL ``icontains``
+# compiles to ``UPPER(col::text) LIKE UPPER('%term%')``, so the indexes are
+# built on that exact expression. Other backends (SQLite in tests), and
+# PostgreSQL servers built without the contrib extensions, skip them; the
+# indexes only speed up search.
+
+from django.db import migrations
+
+TRGM_INDEXES = {
+    "user_email_trgm": "email",
+    "user_username_trgm": "username",
+}
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRGM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "users_user" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_uuid7_pk'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-15
+#
+# Store emails lowercased and enforce uniqueness on UPPER(email), the
+# expression email__iexact lookups compile to.
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    User.objects.exclude(email=Lower("email")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=254, verbose_name='Email address'),
+        ),
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Upper('email'),
+                name='user_email_upper_uniq',
+                violation_error_message='A user with that email address already exists.',
+            ),
+        ),
+    ]
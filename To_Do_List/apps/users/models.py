@@ -1,18 +1,36 @@
-import uuid
-
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models.functions import Upper
+
+from apps.utils import uuid7
 
 
 class User(AbstractUser):
     """Custom user model with UUID and email as primary identifier."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    email = models.EmailField(unique=True, verbose_name="Email address")
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
+    # Stored lowercased; uniqueness is enforced case-insensitively below
+    email = models.EmailField(verbose_name="Email address")
 
     class Meta:
+        # username and email are unique, hence already B-tree indexed. The
+        # trigram indexes behind admin search are PostgreSQL-only, so they are
+        # created in migration 0004 rather than declared here.
         verbose_name = "User"
         verbose_name_plural = "Users"
+        constraints = [
+            # Matches the UPPER(email) = UPPER(%s) that email__iexact compiles
+            # to, so case-insensitive lookups by allauth use this index
+            models.UniqueConstraint(
+                Upper("email"),
+                name="user_email_upper_uniq",
+                violation_error_message="A user with that email address already exists.",
+            ),
+        ]
 
     def __str__(self):
         return self.email
+
+    def save(self, *args, **kwargs):
+        self.email = type(self).objects.normalize_email(self.email).lower()
+        super().save(*args, **kwargs)
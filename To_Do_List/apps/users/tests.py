@@ -3,6 +3,13 @@ from django.contrib.auth import get_user_model
 from django.db import IntegrityError
 from django.urls import reverse
 
+from apps.users.emails import (
+    build_email,
+    send_emails,
+    send_password_reset_email,
+    send_verification_email,
+)
+
 User = get_user_model()
 
 
@@ -44,6 +51,17 @@ class TestUserModel:
         with pytest.raises(IntegrityError):
             User.objects.create_user(username="user2", email="test@example.com", password="pass456")
 
+    def test_user_email_stored_lowercase_and_unique_ignoring_case(self):
+        """Test emails are lowercased on save and unique regardless of case."""
+        user = User.objects.create_user(
+            username="user1", email="Test@Example.COM", password="pass123"
+        )
+        assert user.email == "test@example.com"
+        assert User.objects.get(email__iexact="TEST@example.com") == user
+
+        with pytest.raises(IntegrityError):
+            User.objects.bulk_create([User(username="user2", email="TEST@example.com")])
+
 
 @pytest.mark.django_db
 class TestUserAuthentication:
@@ -77,3 +95,39 @@ class TestUserAuthentication:
         user = User.objects.create_user(username="testuser", email="", password="test123")
         assert user.email == ""
         assert user.username == "testuser"
+
+
+class TestUserEmails:
+    """Test user email helpers."""
+
+    def test_send_password_reset_email(self, mailoutbox):
+        """Test the reset email carries the link in both text and HTML bodies."""
+        send_password_reset_email("user@example.com", "https://example.com/reset/abc/")
+
+        (message,) = mailoutbox
+        assert message.to == ["user@example.com"]
+        assert "https://example.com/reset/abc/" in message.body
+        assert "<a " not in message.body
+        html, mimetype = message.alternatives[0]
+        assert mimetype == "text/html"
+        assert 'href="https://example.com/reset/abc/"' in html
+
+    def test_text_body_not_html_escaped(self, mailoutbox):
+        """Test the plain-text body keeps URLs and names unescaped."""
+        url = "https://example.com/verify/?key=abc&next=/projects/"
+        send_verification_email("user@example.com", url)
+        send_emails([build_email("emails/welcome", {"username": "O'Brien"}, "Hi", "o@example.com")])
+
+        verification, welcome = mailoutbox
+        assert url in verification.body
+        assert "&amp;" in verification.alternatives[0][0]
+        assert "Hi O'Brien," in welcome.body
+
+    def test_send_emails_shares_connection(self, mailoutbox):
+        """Test several emails are sent in one batch."""
+        sent = send_emails(
+            build_email("emails/welcome", {"username": name}, "Welcome", f"{name}@example.com")
+            for name in ("alice", "bob")
+        )
+        assert sent == 2
+        assert [m.to for m in mailoutbox] == [["alice@example.com"], ["bob@example.com"]]
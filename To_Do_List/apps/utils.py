@@ -0,0 +1,85 @@
+"""Helpers shared across apps."""
+
+import os
+import time
+import uuid
+from functools import cache
+
+from django.conf import settings
+from django.db import NotSupportedError
+from django.db.models import BigIntegerField, Expression
+from django.template.loader import get_template
+
+
+@cache
+def _load_template(template_name: str):
+    return get_template(template_name)
+
+
+def cached_template(template_name: str):
+    """
+    Return the compiled template, resolving it through the loaders only once.
+
+    Args:
+        template_name: Template to load
+
+    Returns:
+        Backend template; looked up afresh in DEBUG so edits are picked up
+    """
+    if settings.DEBUG:
+        return get_template(template_name)
+    return _load_template(template_name)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary keys
+    land at the tail of the B-tree instead of at random positions.
+
+    Keys are generated here rather than through a ``db_default``: PostgreSQL's
+    ``gen_random_uuid()`` is a random v4 that would undo that locality, native
+    ``uuidv7()`` needs PostgreSQL 18 (the stack runs 16), and neither exists
+    on the SQLite backend used by the test suite.
+
+    Returns:
+        uuid.UUID: Version 7 UUID with 74 random bits
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # Version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+class SequenceNextval(Expression):
+    """
+    Database default that draws the next value of a PostgreSQL sequence.
+
+    The sequence itself is created by the migration that adds the column.
+    SQLite, used only by the test suite, has no sequences, so there the
+    default falls back to a random non-negative 63-bit integer. Other
+    backends are not supported.
+
+    Args:
+        sequence_name: Name of the sequence to draw from
+    """
+
+    allowed_default = True
+    output_field = BigIntegerField()
+
+    def __init__(self, sequence_name: str):
+        super().__init__()
+        self.sequence_name = sequence_name
+
+    def as_sql(self, compiler, connection):
+        raise NotSupportedError(
+            f"SequenceNextval is not supported on the {connection.vendor} backend."
+        )
+
+    def as_postgresql(self, compiler, connection):
+        return "nextval(%s::regclass)", [connection.ops.quote_name(self.sequence_name)]
+
+    def as_sqlite(self, compiler, connection):
+        return "(RANDOM() & 9223372036854775807)", []
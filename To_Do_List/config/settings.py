@@ -111,6 +111,11 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_HOST"),
         "PORT": os.environ.get("POSTGRES_PORT", 5432),
+        # Persistent connections are opt-in. The Docker image serves
+        # config.asgi with Uvicorn, where they must stay off (0): async code
+        # may run each request on a fresh thread, leaking connections.
+        "CONN_MAX_AGE": int(os.environ.get("CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 